@@ -1,10 +1,40 @@
 import os
 import re
-from task_manager import TaskManager
+import sys
+from task_manager import VALID_FIELDS, TaskManager
+
+def enable_windows_ansi():
+    """Включает обработку ANSI-последовательностей в консоли Windows (по умолчанию она выключена)."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING; до Windows 10 флаг не поддерживается и SetConsoleMode вернет 0
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+def supports_ansi():
+    """Проверяет, понимает ли консоль ANSI-последовательности (в Windows - после их включения)."""
+    if not sys.stdout.isatty():
+        return False
+    if os.name == 'nt':
+        return enable_windows_ansi()
+    return True
+
+ANSI_SUPPORTED = supports_ansi()
 
 def clear_console():
     """Очищает консоль."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if ANSI_SUPPORTED:
+        # Очистка экрана и перевод курсора в начало без запуска внешнего процесса
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
 
 def show_menu():
     """Отображает главное меню."""
@@ -22,6 +52,20 @@ def show_search_info():
     print("- Поиск по регулярным выражениям (например, '/\\d{4}-\\d{2}-\\d{2}/').")
     print("- Поиск по полю (например, '^личное' для точного совпадения).")
 
+def prompt_and_add_task(task_manager):
+    """Запрашивает у пользователя поля новой задачи и добавляет ее."""
+    clear_console()
+    print("Добавление задачи")
+    title = input("Введите заголовок: ")
+    description = input("Введите описание: ")
+    category = input("Введите категорию (учеба, работа, личное, досуг, другое): ")
+    due_date = input("Введите срок выполнения (например, '2024-12-31' или '1h 2m'): ")
+    priority = input("Введите приоритет (высокий, средний, низкий, отсутствует): ")
+    status = input("Введите статус (выполнена, не выполнена, в процессе): ")
+    task_manager.add_task(title, description, category, due_date, priority, status)
+    print("\nЗадача добавлена!")
+    input("\nНажмите Enter, чтобы вернуться...")
+
 def main():
     task_manager = TaskManager("tasks.json")
     while True:
@@ -29,17 +73,7 @@ def main():
             if not task_manager.tasks:
                 print("Нет задач для отображения.")
                 input("\nНажмите Enter, чтобы добавить задачу...")
-                clear_console()
-                print("Добавление задачи")
-                title = input("Введите заголовок: ")
-                description = input("Введите описание: ")
-                category = input("Введите категорию (учеба, работа, личное, досуг, другое): ")
-                due_date = input("Введите срок выполнения (например, '2024-12-31' или '1h 2m'): ")
-                priority = input("Введите приоритет (высокий, средний, низкий, отсутствует): ")
-                status = input("Введите статус (выполнена, не выполнена, в процессе): ")
-                task_manager.add_task(title, description, category, due_date, priority, status)
-                print("\nЗадача добавлена!")
-                input("\nНажмите Enter, чтобы вернуться...")
+                prompt_and_add_task(task_manager)
                 continue
 
             clear_console()
@@ -77,7 +111,7 @@ def main():
                         print("Выражение для поиска не может быть пустым.")
                     else:
                         try:
-                            if field in ['title', 'description', 'category', 'due_date', 'priority', 'status']:
+                            if field in VALID_FIELDS:
                                 tasks = task_manager.search_tasks(search_term, field) if search_term else task_manager.tasks
                             else:
                                 if field:
@@ -96,17 +130,7 @@ def main():
 
             # Добавление задачи
             elif choice == "2":
-                clear_console()
-                print("Добавление задачи")
-                title = input("Введите заголовок: ")
-                description = input("Введите описание: ")
-                category = input("Введите категорию (учеба, работа, личное, досуг, другое): ")
-                due_date = input("Введите срок выполнения (например, '2024-12-31' или '1h 2m'): ")
-                priority = input("Введите приоритет (высокий, средний, низкий, отсутствует): ")
-                status = input("Введите статус (выполнена, не выполнена, в процессе): ")
-                task_manager.add_task(title, description, category, due_date, priority, status)
-                print("\nЗадача добавлена!")
-                input("\nНажмите Enter, чтобы вернуться...")
+                prompt_and_add_task(task_manager)
 
             # Изменение задачи
             elif choice == "3":
@@ -154,7 +178,8 @@ def main():
                 tasks = []
                 if sub_choice == "1":
                     task_id = int(input("Введите ID задачи для удаления: "))
-                    tasks = [task_manager.search_by_id(task_id)]
+                    task = task_manager.search_by_id(task_id)
+                    tasks = [task] if task else []
                 if sub_choice == "2":
                     show_search_info()
                     search_term = input("\nВведите ключевое слово для поиска задач: ")
@@ -171,8 +196,9 @@ def main():
                     print(task)
                 confirm = input("\nВы уверены, что хотите удалить эти задачи? (да/нет): ")
                 if confirm.lower() == "да":
-                    for task in tasks:
-                        task_manager.remove_task(task_id=task.id)
+                    with task_manager.batch():
+                        for task in tasks:
+                            task_manager.remove_task(task_id=task.id)
                     print("\nЗадачи удалены.")
                 else:
                     print("\nУдаление отменено.")
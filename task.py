@@ -1,8 +1,55 @@
 import re
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional, Sequence, Union
 from rapidfuzz import fuzz, process
 
+CATEGORIES = ("учеба", "работа", "личное", "досуг", "другое")
+PRIORITIES = ("высокий", "средний", "низкий", "отсутствует")
+STATUSES = ("выполнена", "не выполнена", "в процессе")
+
+# Абсолютные даты: "%Y-%m-%d", "%Y-%m-%d %H:%M" и "%Y-%m-%dT%H:%M:%S" (поля месяца, дня и времени - 1-2 цифры)
+_ABS_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})(?: (\d{1,2}):(\d{1,2})|T(\d{1,2}):(\d{1,2}):(\d{1,2}))?")
+# Только время: "%H:%M"
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{1,2})")
+
+# Варианты написания единиц измерения относительных дат (например, "1h 2d") и соответствующие им единицы
+_UNIT_CATEGORY = {
+    "year": "year", "years": "year", "y": "year", "год": "year", "годы": "year",
+    "month": "month", "months": "month", "mo": "month", "месяц": "month", "месяцы": "month",
+    "day": "day", "days": "day", "d": "day", "день": "day", "дни": "day",
+    "hour": "hour", "hours": "hour", "h": "hour", "час": "hour", "часы": "hour",
+    "minute": "minute", "minutes": "minute", "m": "minute", "минута": "minute", "минуты": "minute",
+}
+_UNIT_ALIASES = tuple(_UNIT_CATEGORY)
+# Длительность одной единицы; годы и месяцы имеют разную длину и прибавляются к календарной дате отдельно
+_UNIT_DELTA = {"day": timedelta(days=1), "hour": timedelta(hours=1), "minute": timedelta(minutes=1)}
+
+# Интервал целиком: одна или несколько пар "число единица", через пробел или слитно ("2h 30m", "2h30m")
+_DUR_FULL_RE = re.compile(r"(?:\s*\d+\s*[A-Za-zА-Яа-я]+)+\s*")
+# Одна пара "число единица" внутри интервала
+_DUR_RE = re.compile(r"(\d+)\s*([A-Za-zА-Яа-я]+)")
+
+# Множества допустимых значений для быстрой проверки уже канонических значений в _normalize_value
+_VALID_SETS = {values: frozenset(values) for values in (CATEGORIES, PRIORITIES, STATUSES, _UNIT_ALIASES)}
+
+# Поля задачи, значения которых копируются в строку и столбцы для поиска; снаружи они только читаются
+_READ_ONLY_FIELDS = ("title", "description", "category", "priority", "status")
+
+
+def _read_only_field(name: str) -> property:
+    """
+    Свойство для чтения поля задачи, хранящегося в атрибуте с префиксом "_".
+
+    :param name: Название поля.
+    :return: Свойство, при записи в которое возникает AttributeError.
+    """
+    def _set(task, value):
+        raise AttributeError(f"Поле '{name}' изменяется только через TaskManager.update_task.")
+
+    return property(attrgetter(f"_{name}"), _set)
+
 
 class Task:
     """
@@ -10,10 +57,20 @@ class Task:
     заголовок, описание, категорию, срок выполнения, приоритет и статус.
     """
 
+    # Фиксированный набор атрибутов вместо __dict__: меньше памяти на задачу и быстрее доступ к полям
+    __slots__ = ("id", "_title", "_description", "_category", "due_date", "_priority", "_status", "_search_blob")
+
+    # Изменение этих полей в обход TaskManager оставило бы устаревшими строку и столбцы для поиска
+    title = _read_only_field("title")
+    description = _read_only_field("description")
+    category = _read_only_field("category")
+    priority = _read_only_field("priority")
+    status = _read_only_field("status")
+
     _id_counter = 0  # Классовая переменная для автоинкремента идентификатора задач
 
     def __init__(self, title: str, description: Optional[str] = "", category: str = "другое",
-                 due_date: Optional[str] = None, priority: str = "отсутствует",
+                 due_date: Optional[Union[str, int, float, datetime]] = None, priority: str = "отсутствует",
                  status: str = "в процессе", id: Optional[int] = None):
         """
         Инициализация объекта задачи.
@@ -21,21 +78,24 @@ class Task:
         :param title: Заголовок задачи, должен начинаться с буквы или цифры.
         :param description: Описание задачи (может быть пустым).
         :param category: Категория задачи (учеба, работа, личное, досуг, другое).
-        :param due_date: Срок выполнения задачи (строка с датой или временем, например, "1h 2m" или "2024-12-31").
+        :param due_date: Срок выполнения задачи (строка с датой или временем, например, "1h 2m" или "2024-12-31",
+                         время в секундах с начала эпохи, как оно хранится в файле, или готовый datetime).
         :param priority: Приоритет задачи (высокий, средний, низкий, отсутствует).
         :param status: Статус задачи (выполнена, не выполнена, в процессе).
         """
-        if not re.match(r"^[A-Za-zА-Яа-я0-9]", title):
+        # Проверка первого символа без регулярного выражения; пустая строка дает False
+        if not title[:1].isalnum():
             raise ValueError("Заголовок должен начинаться с буквы или цифры.")
-        self.title = title
+        self._title = title
 
-        self.description = description if description else ""
+        self._description = description if description else ""
 
-        self.category = self._normalize_value(category, ["учеба", "работа", "личное", "досуг", "другое"])
-        self.priority = self._normalize_value(priority, ["высокий", "средний", "низкий", "отсутствует"])
-        self.status = self._normalize_value(status, ["выполнена", "не выполнена", "в процессе"])
+        # Канонические значения (например, из JSON) возвращаются _normalize_value без нечеткого поиска
+        self._category = self._normalize_value(category, CATEGORIES)
+        self._priority = self._normalize_value(priority, PRIORITIES)
+        self._status = self._normalize_value(status, STATUSES)
 
-        self.due_date = self._parse_due_date(due_date)
+        self.due_date = self._coerce_due_date(due_date)
 
         if id is None:
             self.id = Task._id_counter
@@ -44,35 +104,85 @@ class Task:
             self.id = id
             Task._id_counter = max(id, Task._id_counter) + 1
 
-    @staticmethod
-    def _normalize_value(input_value: str, valid_values: list[str]) -> str:
-        input_value = input_value.strip().lower()
+        self._refresh_search_blob()
 
-        # Получение лучшего совпадения
-        result = process.extractOne(input_value, valid_values, scorer=fuzz.ratio)
+    @classmethod
+    def _reset_id_counter(cls, start: int = 0):
+        """
+        Сброс счетчика идентификаторов (используется в тестах для детерминированных ID).
 
-        if result is None:  # Если совпадений нет
-            raise ValueError(f"Некорректное значение '{input_value}'. Допустимые варианты: {valid_values}")
+        :param start: Идентификатор, который получит следующая задача без явного ID.
+        """
+        cls._id_counter = start
 
-        best_match, score, _ = result
-        # Устанавливаем порог для принятия результата
-        if score < 70:  # Порог можно настроить
-            raise ValueError(f"Некорректное значение '{input_value}'. Допустимые варианты: {valid_values}")
+    @classmethod
+    def from_trusted_dict(cls, data: dict, now: Optional[datetime] = None) -> "Task":
+        """
+        Создание задачи из словаря в формате to_dict без проверки и нормализации полей.
+        Используется при загрузке задач из файла, где хранятся только ранее проверенные значения.
+        Счетчик идентификаторов не обновляется: это делает вызывающий код после загрузки всех задач.
 
-        return best_match
+        :param data: Словарь с полями задачи.
+        :param now: Текущее время для разбора относительных дат.
+        :return: Объект Task.
+        """
+        task = cls.__new__(cls)
+        task.id = data["id"]
+        task._title = data["title"]
+        task._description = data.get("description") or ""
+        task._category = data["category"]
+        task._priority = data["priority"]
+        task._status = data["status"]
+        task.due_date = cls._coerce_due_date(data["due_date"], now)
+        task._refresh_search_blob()
+        return task
+
+    def _set_fields(self, **fields):
+        """
+        Изменение полей задачи с обновлением строки для поиска (используется TaskManager.update_task).
+
+        :param fields: Новые значения полей вида {название поля: значение}.
+        """
+        for field, value in fields.items():
+            setattr(self, f"_{field}" if field in _READ_ONLY_FIELDS else field, value)
+        self._refresh_search_blob()
+
+    def _refresh_search_blob(self):
+        """
+        Обновление строки для полнотекстового поиска: заголовок, описание, категория и статус,
+        разделенные переводом строки. Вызывается после каждого изменения этих полей.
+        """
+        self._search_blob = f"{self._title}\n{self._description}\n{self._category}\n{self._status}"
 
     @staticmethod
-    def _normalize_value(input_value: str, valid_values: list[str]) -> str:
+    def _normalize_value(input_value: str, valid_values: Sequence[str]) -> str:
         """
         Нормализация значения путем сопоставления с допустимыми вариантами.
 
         :param input_value: Входное значение для нормализации.
-        :param valid_values: Список допустимых значений.
+        :param valid_values: Последовательность допустимых значений.
         :return: Наиболее подходящее значение из valid_values.
         :raises ValueError: Если входное значение не соответствует ни одному допустимому варианту.
         """
-        input_value = input_value.strip().lower()
+        valid_values = tuple(valid_values)
+        stripped = input_value.strip().lower()
+        # Точное совпадение возвращается без нечеткого поиска и обращения к кэшу;
+        # для известных наборов значений проверяется множество, для остальных - сам кортеж
+        if stripped in _VALID_SETS.get(valid_values, valid_values):
+            return stripped
+        return Task._normalize_value_cached(stripped, valid_values)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_value_cached(input_value: str, valid_values: tuple) -> str:
+        """
+        Нормализация значения с кэшированием результата (ошибки не кэшируются).
 
+        :param input_value: Входное значение, уже приведенное к нижнему регистру и без пробелов по краям.
+        :param valid_values: Кортеж допустимых значений.
+        :return: Наиболее подходящее значение из valid_values.
+        :raises ValueError: Если входное значение не соответствует ни одному допустимому варианту.
+        """
         # Поиск наилучшего совпадения
         result = process.extractOne(input_value, valid_values, scorer=fuzz.ratio)
         if result is None:
@@ -84,64 +194,99 @@ class Task:
         return best_match
 
     @staticmethod
-    def _parse_due_date(due_date: Optional[str]) -> datetime:
+    def _coerce_due_date(due_date: Optional[Union[str, int, float, datetime]],
+                         now: Optional[datetime] = None) -> datetime:
+        """
+        Приведение срока выполнения к datetime.
+
+        :param due_date: datetime, время в секундах с начала эпохи или строка для разбора.
+        :param now: Текущее время для относительных дат (по умолчанию datetime.now()).
+        :return: Объект datetime, представляющий дату выполнения.
+        """
+        if isinstance(due_date, datetime):
+            return due_date
+        if isinstance(due_date, (int, float)):
+            return datetime.fromtimestamp(due_date)
+        return Task._parse_due_date(due_date, now)
+
+    @staticmethod
+    def _parse_due_date(due_date: Optional[str], now: Optional[datetime] = None) -> datetime:
         """
         Разбор строки с датой выполнения задачи.
 
         :param due_date: Строка с датой выполнения или None.
+        :param now: Текущее время для относительных дат (по умолчанию datetime.now()).
+                    Позволяет разобрать несколько дат с одним и тем же текущим временем.
         :return: Объект datetime, представляющий дату выполнения.
         """
+        if due_date is not None:
+            parsed_date = Task._parse_due_date_static(due_date)
+            if parsed_date is not None:
+                return parsed_date
+
+        now = now or datetime.now()
         if due_date is None:
-            return datetime.now()
+            return now
+        return Task._parse_due_date_relative(due_date, now)
 
-        date_formats = ["%Y-%m-%d", "%Y-%m-%d %H:%M", "%H:%M", "%Y-%m-%dT%H:%M:%S"]
-        for date_format in date_formats:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_due_date_static(due_date: str) -> Optional[datetime]:
+        """
+        Разбор абсолютной даты, не зависящей от текущего времени. Результат кэшируется.
+
+        :param due_date: Строка с датой выполнения.
+        :return: Объект datetime или None, если строка не является корректной абсолютной датой.
+        """
+        match = _ABS_DATE_RE.fullmatch(due_date)
+        if match is None:
+            return None
+        try:
+            return datetime(*(int(part) for part in match.groups() if part is not None))
+        except ValueError:  # Например, 13-й месяц или 32-е число
+            return None
+
+    @staticmethod
+    def _parse_due_date_relative(due_date: str, now: datetime) -> datetime:
+        """
+        Разбор даты, зависящей от текущего времени: только время ("14:30") или интервал ("1h 2d").
+
+        :param due_date: Строка с датой выполнения.
+        :param now: Текущее время.
+        :return: Объект datetime, представляющий дату выполнения.
+        """
+        match = _TIME_RE.fullmatch(due_date)
+        if match is not None:
             try:
-                parsed_date = datetime.strptime(due_date, date_format)
-                if date_format == "%H:%M":  # Если указано только время, добавляем сегодняшнюю дату
-                    today = datetime.now()
-                    return datetime.combine(today.date(), parsed_date.time())
-                return parsed_date
-            except ValueError:
+                # Если указано только время, добавляем сегодняшнюю дату
+                return datetime.combine(now.date(), time(int(match.group(1)), int(match.group(2))))
+            except ValueError:  # Например, "32:00"
                 pass
 
         # Если явный формат не подошел, парсим относительные даты (например, "1h 2d")
-        units = {
-            "year": ["year", "years", "y", "год", "годы"],
-            "month": ["month", "months", "mo", "месяц", "месяцы"],
-            "day": ["day", "days", "d", "день", "дни"],
-            "hour": ["hour", "hours", "h", "час", "часы"],
-            "minute": ["minute", "minutes", "m", "минута", "минуты"],
-        }
-
         # Инициализация временного дельта
         delta = timedelta()
         extra_months = 0
         extra_years = 0
 
-        # Разделение строки на части и анализ каждой части
-        match_bool = False
-        for part in due_date.split():
-            match = re.match(r"(\d+)\s*(\w+)", part)  # Шаблон: число и единица измерения
-            if match:
-                match_bool = True
-                value, unit = int(match.group(1)), match.group(2).lower()
-                # Нормализация единицы измерения
-                normalized_unit = Task._normalize_value(unit, [key for sublist in units.values() for key in sublist])
-                if normalized_unit in units["year"]:
-                    extra_years += value
-                elif normalized_unit in units["month"]:
-                    extra_months += value
-                elif normalized_unit in units["day"]:
-                    delta += timedelta(days=value)
-                elif normalized_unit in units["hour"]:
-                    delta += timedelta(hours=value)
-                elif normalized_unit in units["minute"]:
-                    delta += timedelta(minutes=value)
-        if not match_bool:
+        # Строка должна целиком состоять из пар "число единица" ("-1d", "1d2" и лишний текст некорректны)
+        if _DUR_FULL_RE.fullmatch(due_date) is None:
             raise ValueError(f"Некорректное значение '{due_date}'.")
-        current_date = datetime.now()
-        future_date = current_date + delta
+
+        # Разбор всех пар "число единица" за один проход
+        for value, unit in _DUR_RE.findall(due_date):
+            value, unit = int(value), unit.lower()
+            # Нормализация единицы измерения: нечеткое сопоставление только для неизвестных вариантов
+            unit_category = _UNIT_CATEGORY.get(unit)
+            if unit_category is None:
+                unit_category = _UNIT_CATEGORY[Task._normalize_value(unit, _UNIT_ALIASES)]
+            if unit_category == "year":
+                extra_years += value
+            elif unit_category == "month":
+                extra_months += value
+            else:
+                delta += value * _UNIT_DELTA[unit_category]
+        future_date = now + delta
 
         # Обработка добавления месяцев и лет
         if extra_months or extra_years:
@@ -161,7 +306,7 @@ class Task:
             "title": self.title,
             "description": self.description,
             "category": self.category,
-            "due_date": self.due_date.strftime('%Y-%m-%d %H:%M') if self.due_date else None,
+            "due_date": int(self.due_date.timestamp()) if self.due_date else None,
             "priority": self.priority,
             "status": self.status
         }
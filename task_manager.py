@@ -1,9 +1,151 @@
 import json
+import mmap
 import os
 import re
-from typing import List, Optional
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
-from task import Task
+from task import CATEGORIES, PRIORITIES, STATUSES, Task
+
+try:
+    import orjson
+except ImportError:  # orjson не установлен - используется стандартный json
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick не установлен - search_by_terms ищет каждое слово отдельно
+    ahocorasick = None
+
+VALID_FIELDS = frozenset(("title", "description", "category", "due_date", "priority", "status"))
+
+# Файлы задач от этого размера отображаются в память, а не читаются целиком (только с orjson)
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Специальные символы регулярных выражений; выражение без них совпадает само с собой как строка
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+# Текстовые поля, значения которых хранятся в отдельных списках параллельно списку задач
+_TEXT_FIELDS = ("title", "description", "category", "priority", "status")
+
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Компиляция регулярного выражения с кэшированием.
+
+    :param pattern: Регулярное выражение.
+    :param flags: Флаги модуля re.
+    :return: Скомпилированное регулярное выражение.
+    """
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=128)
+def _literal_prefilter(pattern: str) -> Optional[str]:
+    """
+    Поиск самой длинной строки, которая обязательно входит в любое совпадение с регулярным выражением.
+    Такая строка проверяется через `in` до запуска регулярного выражения.
+
+    :param pattern: Регулярное выражение.
+    :return: Обязательная подстрока длиной не менее 3 символов или None.
+    """
+    # Альтернативы и группы могут сделать любую часть выражения необязательной
+    if "|" in pattern or "(" in pattern:
+        return None
+
+    runs = []
+    current = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char in "?*{":
+            # Квантификатор делает предыдущий символ необязательным
+            if current:
+                current.pop()
+            runs.append("".join(current))
+            current = []
+            if char == "{":
+                closing = pattern.find("}", i)
+                i = closing if closing != -1 else len(pattern)
+        elif char == "[":
+            runs.append("".join(current))
+            current = []
+            # Пропуск класса символов: ']' сразу после '[' или '[^' входит в класс
+            i += 1
+            if i < len(pattern) and pattern[i] == "^":
+                i += 1
+            if i < len(pattern) and pattern[i] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                if pattern[i] == "\\":
+                    i += 1
+                i += 1
+        elif char == "\\":
+            runs.append("".join(current))
+            current = []
+            # Пропуск экранированной последовательности целиком (\x41, \u0410, \N{...}, \12)
+            i += 1
+            escaped = pattern[i:i + 1]
+            if escaped in ("x", "u", "U"):
+                i += {"x": 2, "u": 4, "U": 8}[escaped]
+            elif escaped == "N":
+                closing = pattern.find("}", i)
+                i = closing if closing != -1 else len(pattern)
+            elif escaped.isdigit():
+                while pattern[i + 1:i + 2].isdigit():
+                    i += 1
+        elif char in ".^$+}":
+            runs.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    runs.append("".join(current))
+
+    literal = max(runs, key=len)
+    return literal if len(literal) >= 3 else None
+
+
+@lru_cache(maxsize=None)
+def _field_getter(field: str) -> Callable[[Task], str]:
+    """
+    Функция получения строкового значения поля задачи, создаваемая один раз для каждого поля.
+
+    :param field: Название поля.
+    :return: Функция, возвращающая str(значение поля) или пустую строку для неизвестного поля.
+    """
+    if field not in VALID_FIELDS and field != "id":
+        return lambda task: ""
+    getter = attrgetter(field)
+    return lambda task: str(getter(task))
+
+
+def _dumps(data) -> bytes:
+    """
+    Сериализация данных в JSON (UTF-8).
+
+    :param data: Данные для сериализации.
+    :return: JSON в виде байтов.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(content):
+    """
+    Разбор JSON из строки или байтов.
+
+    :param content: JSON в виде строки или байтов.
+    :return: Разобранные данные.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 class TaskManager:
@@ -14,8 +156,63 @@ class TaskManager:
         :param filename: Путь к файлу для хранения задач в формате JSON.
         """
         self.filename = filename
+        self._dirty = False
+        self._batching = False
         self.tasks = self._load_tasks()
 
+    @property
+    def tasks(self) -> Tuple[Task, ...]:
+        """
+        Задачи в виде кортежа (снимок на момент обращения). Индексы по ID и столбцы для поиска
+        строятся по внутреннему списку, поэтому задачи меняются только через add_task, remove_task,
+        update_task или присваивание нового списка.
+        """
+        return tuple(self._tasks)
+
+    @tasks.setter
+    def tasks(self, tasks: Iterable[Task]):
+        """
+        Замена списка задач с перестроением индексов по ID и столбцов для поиска.
+
+        :param tasks: Новые объекты Task (копируются во внутренний список).
+        """
+        tasks = list(tasks)
+        self._tasks = tasks
+        self._by_id = {task.id: task for task in tasks}
+        self._pos = {task.id: index for index, task in enumerate(tasks)}
+        # Значения полей хранятся столбцами параллельно списку задач: поиск проходит по плотным спискам строк
+        self._by_field = {field: [getattr(task, field) for task in tasks] for field in _TEXT_FIELDS}
+        self._search_blobs = [task._search_blob for task in tasks]
+
+    def _append_row(self, task: Task):
+        """
+        Добавление значений полей задачи в конец столбцов для поиска.
+
+        :param task: Добавляемая задача.
+        """
+        for field, column in self._by_field.items():
+            column.append(getattr(task, field))
+        self._search_blobs.append(task._search_blob)
+
+    def _write_row(self, index: int, task: Task):
+        """
+        Запись значений полей задачи в столбцы для поиска.
+
+        :param index: Позиция задачи в self._tasks.
+        :param task: Задача, значения которой записываются.
+        """
+        for field, column in self._by_field.items():
+            column[index] = getattr(task, field)
+        self._search_blobs[index] = task._search_blob
+
+    def _pop_row(self):
+        """
+        Удаление последней строки столбцов для поиска.
+        """
+        for column in self._by_field.values():
+            column.pop()
+        self._search_blobs.pop()
+
     def _load_tasks(self) -> List[Task]:
         """
         Загрузка задач из файла JSON.
@@ -26,34 +223,74 @@ class TaskManager:
             return []
 
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                content = f.read().strip()  # Убираем лишние пробелы
-                if not content:  # Если файл пустой
-                    return []
-                data = json.loads(content)  # Загружаем JSON из строки
+            with open(self.filename, 'rb') as f:
+                if orjson is not None and self._file_size() >= _MMAP_THRESHOLD:
+                    # Большой файл: orjson разбирает JSON прямо из отображенной памяти без копии содержимого
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                        data = orjson.loads(view)
+                else:
+                    content = f.read().strip()  # Убираем лишние пробелы
+                    if not content:  # Если файл пустой
+                        return []
+                    data = _loads(content)  # Загружаем JSON из байтов
         except json.JSONDecodeError as e:
             raise ValueError(f"Ошибка при чтении JSON из файла '{self.filename}': {e}") from e
 
-        tasks = []
-        for task_data in data:
-            task = Task(
-                title=task_data["title"],
-                description=task_data.get("description", ""),
-                category=task_data["category"],
-                due_date=task_data["due_date"],
-                priority=task_data["priority"],
-                status=task_data["status"],
-                id=task_data["id"],
-            )
-            tasks.append(task)
+        # Одно текущее время на всю загрузку вместо вызова datetime.now() для каждой задачи
+        now = datetime.now()
+        tasks = [Task.from_trusted_dict(task_data, now) for task_data in data]
+        if tasks:
+            Task._id_counter = max(Task._id_counter, max(task.id for task in tasks) + 1)
         return tasks
 
+    def _file_size(self) -> int:
+        """
+        Размер файла задач в байтах.
+
+        :return: Размер файла или 0, если его не удалось определить.
+        """
+        try:
+            return os.path.getsize(self.filename)
+        except OSError:
+            return 0
+
     def _save_tasks(self):
         """
         Сохранение списка задач в файл JSON.
         """
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            json.dump([task.to_dict() for task in self.tasks], f, ensure_ascii=False, indent=4)
+        with open(self.filename, 'wb') as f:
+            f.write(_dumps([task.to_dict() for task in self._tasks]))
+
+    def _mark_dirty(self):
+        """
+        Пометка задач как измененных. Вне пакетной операции изменения сразу сохраняются в файл.
+        """
+        self._dirty = True
+        if not self._batching:
+            self.flush()
+
+    def flush(self):
+        """
+        Сохранение задач в файл, если есть несохраненные изменения.
+        """
+        if self._dirty:
+            self._save_tasks()
+            self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """
+        Пакетное изменение задач: внутри блока изменения не сохраняются,
+        файл записывается один раз при выходе из блока.
+        """
+        batching = self._batching
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = batching
+            if not batching:
+                self.flush()
 
     def add_task(self, title: str, description: Optional[str] = "", category: str = "другое",
                  due_date: Optional[str] = None, priority: str = "отсутствует", status: str = "в процессе"):
@@ -61,16 +298,31 @@ class TaskManager:
         Добавление новой задачи в список и сохранение в файл.
         """
         task = Task(title, description, category, due_date, priority, status)
-        self.tasks.append(task)
-        self._save_tasks()
+        self._pos[task.id] = len(self._tasks)
+        self._tasks.append(task)
+        self._append_row(task)
+        self._by_id[task.id] = task
+        self._mark_dirty()
 
     def remove_task(self, task_id: int = None):
         """
-        Удаление задачи по ID или категории.
+        Удаление задачи по ID.
+
+        На место удаляемой задачи переносится последняя задача списка, поэтому удаление
+        выполняется за O(1), но порядок оставшихся задач может измениться.
         """
-        if task_id:
-            self.tasks = [task for task in self.tasks if task.id != task_id]
-        self._save_tasks()
+        task = self._by_id.pop(task_id, None)
+        if task is None:
+            return
+
+        index = self._pos.pop(task_id)
+        last = self._tasks.pop()
+        self._pop_row()
+        if last is not task:
+            self._tasks[index] = last
+            self._pos[last.id] = index
+            self._write_row(index, last)
+        self._mark_dirty()
 
     def update_task(self, task_id: int, title: Optional[str] = None, description: Optional[str] = None,
                     category: Optional[str] = None, due_date: Optional[str] = None,
@@ -78,22 +330,28 @@ class TaskManager:
         """
         Изменение информации о задаче по ID.
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                if title:
-                    task.title = title
-                if description:
-                    task.description = description
-                if category:
-                    task.category = Task._normalize_value(category, ["учеба", "работа", "личное", "досуг", "другое"])
-                if due_date:
-                    task.due_date = Task._parse_due_date(due_date)
-                if priority:
-                    task.priority = Task._normalize_value(priority, ["высокий", "средний", "низкий", "отсутствует"])
-                if status:
-                    task.status = Task._normalize_value(status, ["выполнена", "не выполнена", "в процессе"])
-                self._save_tasks()
-                break
+        task = self._by_id.get(task_id)
+        if task is None:
+            return
+
+        # Все значения проверяются до изменения задачи: при ошибке задача и столбцы для поиска остаются прежними
+        changes = {}
+        if title:
+            changes["title"] = title
+        if description:
+            changes["description"] = description
+        if category:
+            changes["category"] = Task._normalize_value(category, CATEGORIES)
+        if due_date:
+            changes["due_date"] = Task._parse_due_date(due_date)
+        if priority:
+            changes["priority"] = Task._normalize_value(priority, PRIORITIES)
+        if status:
+            changes["status"] = Task._normalize_value(status, STATUSES)
+
+        task._set_fields(**changes)
+        self._write_row(self._pos[task_id], task)
+        self._mark_dirty()
 
     def mark_as_done(self, task_id: int):
         """
@@ -101,17 +359,60 @@ class TaskManager:
         """
         self.update_task(task_id, status="выполнена")
 
-    def search_by_regex(self, pattern: str) -> List[Task]:
+    def search_by_regex(self, pattern: str, flags: int = 0, field: Optional[str] = None) -> List[Task]:
         """
         Поиск задач по регулярному выражению.
 
         :param pattern: Регулярное выражение для поиска.
+        :param flags: Флаги модуля re (например, re.IGNORECASE).
+        :param field: Поле, в котором производится поиск (по умолчанию - заголовок, описание, категория и статус).
         :return: Список найденных задач.
+        :raises TypeError: Если название поля не является строкой.
         """
-        return [task for task in self.tasks if re.search(pattern, task.title) or
-                re.search(pattern, task.description) or
-                re.search(pattern, task.category) or
-                re.search(pattern, task.status)]
+        if field is not None and not isinstance(field, str):
+            raise TypeError(f"Название поля должно быть строкой, получено: {field!r}")
+
+        tasks = self._tasks
+        if not field:
+            return self._search_regex_in_text_fields(pattern, flags)
+        if field in self._by_field:
+            values = self._by_field[field]
+        else:
+            values = [_field_getter(field)(task) for task in tasks]
+
+        # Флаги (например, IGNORECASE) меняют смысл литералов, поэтому без регулярного выражения
+        # можно обойтись только при их отсутствии
+        if not flags and not _REGEX_METACHARS.intersection(pattern):
+            return [tasks[i] for i, value in enumerate(values) if pattern in value]
+
+        regex = _compile_pattern(pattern, flags)
+        literal = _literal_prefilter(pattern) if not flags else None
+        if literal is None:
+            return [tasks[i] for i, value in enumerate(values) if regex.search(value)]
+        return [tasks[i] for i, value in enumerate(values) if literal in value and regex.search(value)]
+
+    def _search_regex_in_text_fields(self, pattern: str, flags: int) -> List[Task]:
+        """
+        Поиск по регулярному выражению в заголовке, описании, категории и статусе.
+        Выражение применяется к каждому полю отдельно, чтобы совпадение не захватывало соседние поля,
+        а объединенная строка полей используется только для проверки обязательной подстроки.
+
+        :param pattern: Регулярное выражение для поиска.
+        :param flags: Флаги модуля re.
+        :return: Список найденных задач.
+        """
+        tasks = self._tasks
+        blobs = self._search_blobs
+        # Строка без специальных символов и перевода строки не может совпасть на границе двух полей
+        if not flags and not _REGEX_METACHARS.intersection(pattern) and "\n" not in pattern:
+            return [tasks[i] for i, blob in enumerate(blobs) if pattern in blob]
+
+        regex = _compile_pattern(pattern, flags)
+        literal = _literal_prefilter(pattern) if not flags else None
+        rows = zip(self._by_field["title"], self._by_field["description"],
+                   self._by_field["category"], self._by_field["status"])
+        return [tasks[i] for i, row in enumerate(rows)
+                if (literal is None or literal in blobs[i]) and any(regex.search(value) for value in row)]
 
     def search_by_prefix(self, prefix: str, field: Optional[str] = None) -> List[Task]:
         """
@@ -121,15 +422,23 @@ class TaskManager:
         :param field: Поле, в котором производится поиск.
         :return: Список найденных задач.
         """
+        tasks = self._tasks
+        if field in self._by_field:
+            # Текстовое поле: проход по столбцу значений без обращения к атрибутам задач
+            return [tasks[i] for i, value in enumerate(self._by_field[field]) if value.startswith(prefix)]
         if field:
-            return [task for task in self.tasks if str(getattr(task, field, "")).startswith(prefix)]
-
-        return [task for task in self.tasks if task.title.startswith(prefix) or
-                task.description.startswith(prefix) or
-                task.category.startswith(prefix) or
-                task.status.startswith(prefix) or
-                str(task.id).startswith(prefix) or
-                str(task.due_date).startswith(prefix)
+            get_value = _field_getter(field)
+            return [task for task in tasks if get_value(task).startswith(prefix)]
+
+        columns = zip(self._by_field["title"], self._by_field["description"],
+                      self._by_field["category"], self._by_field["status"])
+        return [tasks[i] for i, (title, description, category, status) in enumerate(columns)
+                if title.startswith(prefix) or
+                description.startswith(prefix) or
+                category.startswith(prefix) or
+                status.startswith(prefix) or
+                str(tasks[i].id).startswith(prefix) or
+                str(tasks[i].due_date).startswith(prefix)
         ]
 
     def search_by_term(self, search_term: str, field: Optional[str] = None) -> List[Task]:
@@ -140,21 +449,61 @@ class TaskManager:
         :param field: Поле, в котором производится поиск.
         :return: Список найденных задач.
         """
+        tasks = self._tasks
+        if field in self._by_field:
+            # Текстовое поле: проход по столбцу значений без обращения к атрибутам задач
+            return [tasks[i] for i, value in enumerate(self._by_field[field]) if search_term in value]
         if field:
-            # Получение значения поля
-            return [
-                task for task in self.tasks
-                if str(search_term) in str(getattr(task, field, ""))
-            ]
+            # Нетекстовое поле (id, due_date): значение получается заранее подготовленной для поля функцией
+            get_value = _field_getter(field)
+            return [task for task in tasks if str(search_term) in get_value(task)]
         return [
-            task for task in self.tasks
-            if search_term in task.title or
-               search_term in task.description or
-               search_term in task.category or
-               search_term in task.status or
-               str(search_term) in str(task.due_date)
+            tasks[i] for i, blob in enumerate(self._search_blobs)
+            if search_term in blob or
+               str(search_term) in str(tasks[i].due_date)
         ]
 
+    def find_first(self, predicate: Callable[[Task], bool]) -> Optional[Task]:
+        """
+        Поиск первой задачи, удовлетворяющей условию. Перебор останавливается на первом совпадении.
+        Для поиска по ID используйте search_by_id: он находит задачу по словарю без перебора.
+
+        :param predicate: Функция, принимающая задачу и возвращающая True для подходящей задачи.
+        :return: Найденная задача или None.
+        """
+        return next((task for task in self._tasks if predicate(task)), None)
+
+    def search_by_terms(self, search_terms: List[str], field: Optional[str] = None) -> Dict[str, List[Task]]:
+        """
+        Полный поиск сразу по нескольким ключевым словам.
+        При наличии pyahocorasick все слова ищутся за один проход по каждой задаче (автомат Ахо-Корасик),
+        иначе для каждого слова вызывается search_by_term.
+
+        :param search_terms: Ключевые слова для поиска.
+        :param field: Поле, в котором производится поиск.
+        :return: Словарь {ключевое слово: список найденных задач}, результаты совпадают с search_by_term.
+        """
+        terms = list(dict.fromkeys(search_terms))
+        if ahocorasick is None or "" in terms or (field and field not in self._by_field):
+            return {term: self.search_by_term(term, field) for term in terms}
+
+        automaton = ahocorasick.Automaton()
+        for index, term in enumerate(terms):
+            automaton.add_word(term, index)
+        automaton.make_automaton()
+
+        tasks = self._tasks
+        values = self._by_field[field] if field else self._search_blobs
+        found = {term: [] for term in terms}
+        for i, value in enumerate(values):
+            matched = {index for _, index in automaton.iter(value)}
+            if not field:
+                # Как и search_by_term, без указания поля проверяется также срок выполнения
+                matched.update(index for _, index in automaton.iter(str(tasks[i].due_date)))
+            for index in sorted(matched):
+                found[terms[index]].append(tasks[i])
+        return found
+
     def search_by_id(self, task_id: int) -> Optional[Task]:
         """
         Поиск задачи по ID.
@@ -162,9 +511,7 @@ class TaskManager:
         :param task_id: ID задачи.
         :return: Найденная задача или None.
         """
-        # Используем поиск по полю id
-        result = self.search_by_prefix(str(task_id), "id")
-        return result[0]
+        return self._by_id.get(task_id)
 
     def search_tasks(self, search_term: str, field: Optional[str] = None) -> List[Task]:
         """
@@ -0,0 +1,8 @@
+import pytest
+from task import Task
+
+
+@pytest.fixture(autouse=True)
+def reset_task_id_counter():
+    """Сбрасывает счетчик идентификаторов задач перед каждым тестом."""
+    Task._reset_id_counter()
@@ -1,14 +1,28 @@
 from datetime import datetime, timedelta
 
+import io
+import mmap
+import re
 import pytest
 import json
-from unittest.mock import patch, mock_open
-from task_manager import TaskManager
+from unittest.mock import patch
+import task_manager as task_manager_module
+from task_manager import TaskManager, _compile_pattern, _literal_prefilter
 from task import Task
 
 
+def fake_open(data):
+    """Замена open, возвращающая файл в памяти с заданным содержимым и считающая вызовы."""
+    def _open(*args, **kwargs):
+        _open.call_count += 1
+        return io.BytesIO(data)
+
+    _open.call_count = 0
+    return _open
+
+
 # Фикстуры
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_task_file():
     """Мок задачи для тестов."""
     tasks = [
@@ -31,23 +45,29 @@ def mock_task_file():
             "status": "в процессе"
         }
     ]
-    return json.dumps(tasks)
+    return json.dumps(tasks, ensure_ascii=False).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def parsed_tasks(mock_task_file):
+    """Разобранные задачи из mock_task_file (только для чтения)."""
+    return json.loads(mock_task_file)
 
 
 @pytest.fixture
-def mock_file_system(mock_task_file):
+def mock_file_system(monkeypatch, mock_task_file):
     """Мок для файловой системы."""
-    with patch("builtins.open", mock_open(read_data=mock_task_file)) as mocked_file, \
-            patch("os.path.exists", return_value=True):
-        yield mocked_file
+    mocked_file = fake_open(mock_task_file)
+    monkeypatch.setattr("builtins.open", mocked_file)
+    monkeypatch.setattr("os.path.exists", lambda path: True)
+    return mocked_file
 
 
 @pytest.fixture
-def empty_file_system():
+def empty_file_system(monkeypatch):
     """Мок для пустого файла."""
-    with patch("builtins.open", mock_open(read_data="")), \
-            patch("os.path.exists", return_value=True):
-        yield
+    monkeypatch.setattr("builtins.open", fake_open(b""))
+    monkeypatch.setattr("os.path.exists", lambda path: True)
 
 
 @pytest.fixture
@@ -56,6 +76,14 @@ def task_manager(mock_file_system):
     return TaskManager("mock_file.json")
 
 
+@pytest.fixture
+def empty_task_manager(monkeypatch):
+    """Создает TaskManager без файла задач - для тестов, которые сами задают список задач."""
+    monkeypatch.setattr("builtins.open", fake_open(b""))
+    monkeypatch.setattr("os.path.exists", lambda path: False)
+    return TaskManager("mock_file.json")
+
+
 # Тесты инициализации
 def test_init_with_existing_file(mock_file_system):
     """Тест инициализации менеджера с существующим файлом."""
@@ -76,12 +104,41 @@ def test_init_with_missing_file():
         assert len(manager.tasks) == 0
 
 
-def test_tomli_tasks_invalid_json():
+def test_tomli_tasks_invalid_json(monkeypatch):
     """Тест загрузки задач из файла с некорректным JSON."""
-    with patch("builtins.open", mock_open(read_data="{invalid_json}")), \
-            patch("os.path.exists", return_value=True):
-        with pytest.raises(ValueError, match="Ошибка при чтении JSON из файла"):
-            TaskManager("invalid_file.json")
+    monkeypatch.setattr("builtins.open", fake_open(b"{invalid_json}"))
+    monkeypatch.setattr("os.path.exists", lambda path: True)
+    with pytest.raises(ValueError, match="Ошибка при чтении JSON из файла"):
+        TaskManager("invalid_file.json")
+
+
+def test_init_with_large_file(monkeypatch, tmp_path, mock_task_file):
+    """Тест загрузки файла не меньше порога через отображение в память."""
+    pytest.importorskip("orjson")
+    mapped_files = []
+    original_mmap = mmap.mmap
+
+    def counting_mmap(*args, **kwargs):
+        mapped_files.append(args)
+        return original_mmap(*args, **kwargs)
+
+    monkeypatch.setattr(task_manager_module, "_MMAP_THRESHOLD", len(mock_task_file))
+    monkeypatch.setattr(mmap, "mmap", counting_mmap)
+    task_file = tmp_path / "tasks.json"
+    task_file.write_bytes(mock_task_file)
+
+    manager = TaskManager(str(task_file))
+    assert len(mapped_files) == 1
+    assert [task.id for task in manager.tasks] == [3, 5]
+    assert manager.tasks[1].title == "Личная задача"
+
+
+def test_dumps_layout_does_not_depend_on_orjson(monkeypatch, parsed_tasks):
+    """Тест того, что файл задач записывается одинаково с orjson и со стандартным json."""
+    pytest.importorskip("orjson")
+    with_orjson = task_manager_module._dumps(parsed_tasks)
+    monkeypatch.setattr(task_manager_module, "orjson", None)
+    assert task_manager_module._dumps(parsed_tasks) == with_orjson
 
 
 # Тесты добавления задач
@@ -92,21 +149,85 @@ def test_add_task(task_manager):
     assert task_manager.tasks[-1].title == "New Task"
 
 
+def test_add_task_updates_id_index(task_manager):
+    """Тест того, что добавленная задача находится по ID и удаляется по нему."""
+    task_manager.add_task(title="New Task")
+    task = task_manager.tasks[-1]
+    assert task_manager.search_by_id(task.id) is task
+    task_manager.remove_task(task_id=task.id)
+    assert task_manager.search_by_id(task.id) is None
+    assert len(task_manager.tasks) == 2
+
+
+def test_tasks_cannot_be_changed_in_place(empty_task_manager):
+    """Тест того, что список задач нельзя изменить в обход индексов и столбцов для поиска."""
+    source = [Task(id=1, title="Old")]
+    empty_task_manager.tasks = source
+    source.append(Task(id=2, title="Appended"))
+    with pytest.raises(AttributeError):
+        empty_task_manager.tasks.append(Task(id=3, title="Appended"))
+    assert [task.id for task in empty_task_manager.tasks] == [1]
+    assert empty_task_manager.search_by_id(2) is None
+    assert empty_task_manager.search_by_term("Appended") == []
+
+
 # Тесты удаления задач
-def test_remove_task_by_id(task_manager):
+def test_remove_task_by_id(empty_task_manager):
     """Тест удаления задачи по ID."""
-    task_manager.tasks = [Task(id=1, title="Task 1"), Task(id=2, title="Task 2")]
-    task_manager.remove_task(task_id=1)
-    assert len(task_manager.tasks) == 1
-    assert task_manager.tasks[0].id == 2
+    empty_task_manager.tasks = [Task(id=1, title="Task 1"), Task(id=2, title="Task 2")]
+    empty_task_manager.remove_task(task_id=1)
+    assert len(empty_task_manager.tasks) == 1
+    assert empty_task_manager.tasks[0].id == 2
 
 
 # Тесты удаления задач
-def test_remove_task_by_invalid_id(task_manager):
+def test_remove_task_by_invalid_id(empty_task_manager):
     """Тест удаления задачи по ID."""
+    empty_task_manager.tasks = [Task(id=1, title="Task 1"), Task(id=2, title="Task 2")]
+    empty_task_manager.remove_task(task_id=10)
+    assert len(empty_task_manager.tasks) == 2
+
+
+def test_remove_task_updates_id_index(empty_task_manager):
+    """Тест того, что удаленная задача не находится по ID."""
+    empty_task_manager.tasks = [Task(id=1, title="Task 1"), Task(id=2, title="Task 2")]
+    empty_task_manager.remove_task(task_id=1)
+    assert empty_task_manager.search_by_id(1) is None
+    assert empty_task_manager.search_by_id(2).id == 2
+
+
+def test_remove_task_from_middle(empty_task_manager):
+    """Тест удаления задачи из середины списка."""
+    empty_task_manager.tasks = [Task(id=1, title="Task 1"), Task(id=2, title="Task 2"), Task(id=3, title="Task 3")]
+    empty_task_manager.remove_task(task_id=1)
+    empty_task_manager.remove_task(task_id=3)
+    assert [task.id for task in empty_task_manager.tasks] == [2]
+    assert empty_task_manager.search_by_id(2).id == 2
+    assert [task.id for task in empty_task_manager.search_by_term("Task", "title")] == [2]
+    assert [task.id for task in empty_task_manager.search_by_term("Task")] == [2]
+
+
+def test_remove_all_tasks(empty_task_manager):
+    """Тест удаления всех задач при переборе task_manager.tasks, как при удалении всех задач в консоли."""
+    empty_task_manager.tasks = [Task(id=i, title=f"Task {i}") for i in range(1, 7)]
+    with empty_task_manager.batch():
+        for task in empty_task_manager.tasks:
+            empty_task_manager.remove_task(task_id=task.id)
+    assert empty_task_manager.tasks == ()
+    assert all(empty_task_manager.search_by_id(i) is None for i in range(1, 7))
+    assert empty_task_manager.search_by_term("Task") == []
+
+
+def test_remove_tasks_in_batch_saves_once(task_manager, mock_file_system):
+    """Тест того, что пакетное удаление записывает файл один раз."""
     task_manager.tasks = [Task(id=1, title="Task 1"), Task(id=2, title="Task 2")]
-    task_manager.remove_task(task_id=10)
-    assert len(task_manager.tasks) == 2
+    mock_file_system.call_count = 0
+    with task_manager.batch():
+        task_manager.remove_task(task_id=1)
+        task_manager.remove_task(task_id=2)
+        assert mock_file_system.call_count == 0
+    assert mock_file_system.call_count == 1
+    assert len(task_manager.tasks) == 0
 
 
 # Тесты обновления задач
@@ -123,13 +244,13 @@ from task import Task
     ("priority", "средний", "средний"),
     ("status", "выполнена", "выполнена"),
 ])
-def test_update_task_positive(task_manager, field, value, expected):
+def test_update_task_positive(empty_task_manager, field, value, expected):
     """Позитивный тест обновления задачи по всем возможным полям."""
-    task_manager.tasks = [Task(id=1, title="Task 1", status="в процессе")]
+    empty_task_manager.tasks = [Task(id=1, title="Task 1", status="в процессе")]
     update_kwargs = {field: value}
-    task_manager.update_task(1, **update_kwargs)
+    empty_task_manager.update_task(1, **update_kwargs)
 
-    updated_task = task_manager.tasks[0]
+    updated_task = empty_task_manager.tasks[0]
     actual = getattr(updated_task, field)
     if field == "due_date":
         # Форматирование даты для проверки
@@ -144,21 +265,55 @@ def test_update_task_positive(task_manager, field, value, expected):
     ("status", "завершено"),  # Некорректный статус
     ("due_date", "invalid_date"),  # Некорректная дата
 ])
-def test_update_task_negative(task_manager, field, invalid_value):
+def test_update_task_negative(empty_task_manager, field, invalid_value):
     """Негативный тест обновления задачи с некорректными значениями."""
-    task_manager.tasks = [Task(id=1, title="Task 1", status="в процессе")]
+    empty_task_manager.tasks = [Task(id=1, title="Task 1", status="в процессе")]
     update_kwargs = {field: invalid_value}
 
     with pytest.raises(ValueError):
-        task_manager.update_task(1, **update_kwargs)
+        empty_task_manager.update_task(1, **update_kwargs)
+
+
+def test_update_task_refreshes_search(empty_task_manager):
+    """Тест того, что поиск учитывает обновленные поля задачи."""
+    empty_task_manager.tasks = [Task(id=1, title="Task 1")]
+    empty_task_manager.update_task(1, title="Обновленная задача")
+    assert len(empty_task_manager.search_by_term("Обновленная")) == 1
+    assert len(empty_task_manager.search_by_term("Обновленная", "title")) == 1
+    assert len(empty_task_manager.search_by_regex(r"^Обновл")) == 1
+    assert len(empty_task_manager.search_by_term("Task 1")) == 0
+
+
+def test_update_task_invalid_value_keeps_task(empty_task_manager):
+    """Тест того, что при некорректном значении задача не изменяется ни в одном поле."""
+    empty_task_manager.tasks = [Task(id=1, title="Task 1", category="работа")]
+    with pytest.raises(ValueError):
+        empty_task_manager.update_task(1, title="Новое", category="zzzz")
+    assert empty_task_manager.tasks[0].title == "Task 1"
+    assert empty_task_manager.tasks[0].category == "работа"
+    assert len(empty_task_manager.search_by_term("Task 1", "title")) == 1
+    assert empty_task_manager.search_by_term("Новое") == []
+
+
+def test_task_fields_cannot_be_set_directly(empty_task_manager):
+    """Тест того, что поля задачи нельзя изменить в обход update_task и поиск остается согласованным."""
+    empty_task_manager.tasks = [Task(id=1, title="Task 1")]
+    task = empty_task_manager.search_by_id(1)
+    with pytest.raises(AttributeError):
+        task.title = "New title"
+    with pytest.raises(AttributeError):
+        task.status = "выполнена"
+    assert task.title == "Task 1"
+    assert len(empty_task_manager.search_by_term("Task 1", "title")) == 1
+    assert empty_task_manager.search_by_prefix("выпол", "status") == []
 
 
 # Тесты отметки выполнения задач
-def test_mark_as_done(task_manager):
+def test_mark_as_done(empty_task_manager):
     """Тест отметки задачи как выполненной."""
-    task_manager.tasks = [Task(id=1, title="Task 1", status="в процессе")]
-    task_manager.mark_as_done(1)
-    assert task_manager.tasks[0].status == "выполнена"
+    empty_task_manager.tasks = [Task(id=1, title="Task 1", status="в процессе")]
+    empty_task_manager.mark_as_done(1)
+    assert empty_task_manager.tasks[0].status == "выполнена"
 
 
 # Тесты поиска
@@ -168,12 +323,11 @@ def test_mark_as_done(task_manager):
     ("category", r"личное", 1),
     ("status", r"в процессе", 2),
 ])
-def test_search_by_regex_positive(task_manager, mock_task_file, field, pattern, expected_count):
+def test_search_by_regex_positive(empty_task_manager, parsed_tasks, field, pattern, expected_count):
     """Позитивный тест поиска задач по регулярному выражению."""
-    with patch("builtins.open", mock_open(read_data=mock_task_file)):
-        task_manager.tasks = [Task(**task) for task in json.loads(mock_task_file)]
-        tasks = task_manager.search_by_regex(pattern)
-        assert len(tasks) == expected_count
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    tasks = empty_task_manager.search_by_regex(pattern)
+    assert len(tasks) == expected_count
 
 
 @pytest.mark.parametrize("field, pattern", [
@@ -181,12 +335,72 @@ def test_search_by_regex_positive(task_manager, mock_task_file, field, pattern,
     ("description", r"Несуществующее описание"),
     ("category", r"несуществующая категория"),
 ])
-def test_search_by_regex_negative(task_manager, mock_task_file, field, pattern):
+def test_search_by_regex_negative(empty_task_manager, parsed_tasks, field, pattern):
     """Негативный тест поиска задач по регулярному выражению."""
-    with patch("builtins.open", mock_open(read_data=mock_task_file)):
-        task_manager.tasks = [Task(**task) for task in json.loads(mock_task_file)]
-        tasks = task_manager.search_by_regex(pattern)
-        assert len(tasks) == 0
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    tasks = empty_task_manager.search_by_regex(pattern)
+    assert len(tasks) == 0
+
+
+@pytest.mark.parametrize("field, pattern, expected_count", [
+    ("title", r"^Задача", 1),
+    ("description", r"^Задача", 1),
+    ("category", r"^(работа|личное)$", 2),
+    ("status", r"в процессе", 2),
+    ("id", r"^[35]$", 2),
+    ("due_date", r"^2024-12-31", 2),
+])
+def test_search_by_regex_in_field(empty_task_manager, parsed_tasks, field, pattern, expected_count):
+    """Тест поиска задач по регулярному выражению в заданном поле."""
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    assert len(empty_task_manager.search_by_regex(pattern, field=field)) == expected_count
+
+
+def test_search_by_regex_with_flags(empty_task_manager, parsed_tasks):
+    """Тест передачи флагов вторым позиционным аргументом и проверки типа поля."""
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    assert len(empty_task_manager.search_by_regex(r"задача", re.IGNORECASE)) == 2
+    assert len(empty_task_manager.search_by_regex(r"^задача", re.IGNORECASE, "title")) == 1
+    with pytest.raises(TypeError):
+        empty_task_manager.search_by_regex(r"задача", 0, 2)
+
+
+@pytest.mark.parametrize("pattern, expected_count", [
+    (r"1\s+Описание", 0),  # Совпадение не должно переходить из заголовка в описание
+    (r"\Aработа", 1),  # \A и \Z привязаны к началу и концу каждого поля
+    (r"работа\Z", 1),
+    ("1\nОписание", 0),
+])
+def test_search_by_regex_does_not_cross_fields(empty_task_manager, pattern, expected_count):
+    """Тест того, что регулярное выражение без указания поля применяется к каждому полю отдельно."""
+    empty_task_manager.tasks = [Task(id=1, title="Задача 1", description="Описание", category="работа")]
+    assert len(empty_task_manager.search_by_regex(pattern)) == expected_count
+
+
+def test_search_by_regex_reuses_compiled_pattern(empty_task_manager):
+    """Тест того, что повторный поиск использует уже скомпилированное выражение."""
+    empty_task_manager.tasks = [Task(id=1, title="Задача 1"), Task(id=2, title="Задача 2")]
+    _compile_pattern.cache_clear()
+    assert len(empty_task_manager.search_by_regex(r"^Задача \d$")) == 2
+    assert len(empty_task_manager.search_by_regex(r"^Задача \d$")) == 2
+    cache_info = _compile_pattern.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+@pytest.mark.parametrize("pattern, expected_literal", [
+    (r"Описание задачи", "Описание задачи"),
+    (r"^Задача \d+$", "Задача "),
+    (r"задачи?", "задач"),
+    (r"[Зз]адача", "адача"),
+    (r"\x41bcd", "bcd"),
+    (r"Задача|Описание", None),
+    (r"(?i)задача", None),
+    (r"\d{4}-\d{2}", None),
+])
+def test_literal_prefilter(pattern, expected_literal):
+    """Тест выделения обязательной подстроки из регулярного выражения."""
+    assert _literal_prefilter(pattern) == expected_literal
 
 
 @pytest.mark.parametrize("field, pattern, expected_count", [
@@ -195,12 +409,24 @@ def test_search_by_regex_negative(task_manager, mock_task_file, field, pattern):
     ("category", "личное", 1),
     ("status", "в процессе", 2),
 ])
-def test_search_by_prefix_positive(task_manager, mock_task_file, field, pattern, expected_count):
+def test_search_by_prefix_positive(empty_task_manager, parsed_tasks, field, pattern, expected_count):
     """Позитивный тест поиска задач по регулярному выражению."""
-    with patch("builtins.open", mock_open(read_data=mock_task_file)):
-        task_manager.tasks = [Task(**task) for task in json.loads(mock_task_file)]
-        tasks = task_manager.search_by_prefix(pattern)
-        assert len(tasks) == expected_count
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    tasks = empty_task_manager.search_by_prefix(pattern)
+    assert len(tasks) == expected_count
+
+
+@pytest.mark.parametrize("field, pattern, expected_count", [
+    ("title", "Задача", 1),
+    ("description", "Задача", 1),
+    ("category", "лич", 1),
+    ("priority", "высок", 1),
+    ("status", "в процессе", 2),
+])
+def test_search_by_prefix_in_field(empty_task_manager, parsed_tasks, field, pattern, expected_count):
+    """Тест поиска задач по префиксу в заданном поле."""
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    assert len(empty_task_manager.search_by_prefix(pattern, field)) == expected_count
 
 
 @pytest.mark.parametrize("field, pattern", [
@@ -208,20 +434,10 @@ def test_search_by_prefix_positive(task_manager, mock_task_file, field, pattern,
     ("description", "Несуществующее описание"),
     ("category", "несуществующая категория"),
 ])
-def test_search_by_prefix_negative(task_manager, mock_task_file, field, pattern):
+def test_search_by_prefix_negative(empty_task_manager, parsed_tasks, field, pattern):
     """Негативный тест поиска задач по префиксному выражению."""
-    with patch("builtins.open", mock_open(read_data=mock_task_file)):
-        task_manager.tasks = [Task(**task) for task in json.loads(mock_task_file)]
-
-        if field == "title":
-            tasks = task_manager.search_by_prefix(pattern)
-            assert len(tasks) == 0
-        elif field == "description":
-            tasks = task_manager.search_by_prefix(pattern)
-            assert len(tasks) == 0
-        elif field == "category":
-            tasks = task_manager.search_by_prefix(pattern)
-            assert len(tasks) == 0
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    assert len(empty_task_manager.search_by_prefix(pattern)) == 0
 
 
 @pytest.mark.parametrize("field, pattern, expected_count", [
@@ -230,12 +446,11 @@ def test_search_by_prefix_negative(task_manager, mock_task_file, field, pattern)
     ("category", "лич", 1),
     ("status", "цессе", 2),
 ])
-def test_search_by_term_positive(task_manager, mock_task_file, field, pattern, expected_count):
+def test_search_by_term_positive(empty_task_manager, parsed_tasks, field, pattern, expected_count):
     """Позитивный тест поиска задач по терм выражению."""
-    with patch("builtins.open", mock_open(read_data=mock_task_file)):
-        task_manager.tasks = [Task(**task) for task in json.loads(mock_task_file)]
-        tasks = task_manager.search_by_term(pattern)
-        assert len(tasks) == expected_count
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    tasks = empty_task_manager.search_by_term(pattern)
+    assert len(tasks) == expected_count
 
 
 @pytest.mark.parametrize("field, pattern", [
@@ -243,31 +458,57 @@ def test_search_by_term_positive(task_manager, mock_task_file, field, pattern, e
     ("description", "Несуществующее описание"),
     ("category", "несуществующая категория"),
 ])
-def test_search_by_term_negative(task_manager, mock_task_file, field, pattern):
+def test_search_by_term_negative(empty_task_manager, parsed_tasks, field, pattern):
     """Негативный тест поиска задач по терм выражению."""
-    with patch("builtins.open", mock_open(read_data=mock_task_file)):
-        task_manager.tasks = [Task(**task) for task in json.loads(mock_task_file)]
-        tasks = task_manager.search_by_term(pattern)
-        assert len(tasks) == 0
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    tasks = empty_task_manager.search_by_term(pattern)
+    assert len(tasks) == 0
+
+
+@pytest.mark.parametrize("terms, field", [
+    (["Зада", "личн", "цессе"], None),
+    (["Задача 1", "Личная", "Несуществующая"], "title"),
+    (["по личным", "задачи 1", "Описание", "делам"], "description"),
+    (["2024-12-31", "работа"], None),
+])
+def test_search_by_terms(empty_task_manager, parsed_tasks, terms, field):
+    """Тест поиска сразу по нескольким ключевым словам."""
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    result = empty_task_manager.search_by_terms(terms, field)
+    assert list(result) == terms
+    for term in terms:
+        assert result[term] == empty_task_manager.search_by_term(term, field)
+
+
+def test_search_by_non_text_fields(empty_task_manager):
+    """Тест поиска по нетекстовым и неизвестным полям."""
+    empty_task_manager.tasks = [Task(id=12, title="Task 1", due_date="2024-12-31"), Task(id=3, title="Task 2")]
+    assert [task.id for task in empty_task_manager.search_by_prefix("1", "id")] == [12]
+    assert [task.id for task in empty_task_manager.search_by_term("2024-12-31", "due_date")] == [12]
+    assert empty_task_manager.search_by_term("Task", "unknown_field") == []
+
+
+def test_find_first(empty_task_manager):
+    """Тест поиска первой задачи по условию."""
+    empty_task_manager.tasks = [Task(id=1, title="Task 1", category="работа"), Task(id=2, title="Task 2", category="работа")]
+    assert empty_task_manager.find_first(lambda task: task.category == "работа").id == 1
+    assert empty_task_manager.find_first(lambda task: task.category == "личное") is None
 
 
-def test_search_by_id_positive(task_manager, mock_task_file):
+def test_search_by_id_positive(empty_task_manager, parsed_tasks):
     """Позитивный тест поиска задач по префиксному выражению."""
-    with patch("builtins.open", mock_open(read_data=mock_task_file)):
-        task_manager.tasks = [Task(**task) for task in json.loads(mock_task_file)]
-        task = task_manager.search_by_id(3)
-        assert task.id == 3
-        task = task_manager.search_by_id(5)
-        assert task.id == 5
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    task = empty_task_manager.search_by_id(3)
+    assert task.id == 3
+    task = empty_task_manager.search_by_id(5)
+    assert task.id == 5
 
 
-def test_search_by_id_negative(task_manager, mock_task_file):
+def test_search_by_id_negative(empty_task_manager, parsed_tasks):
     """Негативный тест поиска задач по регулярному выражению."""
-    with patch("builtins.open", mock_open(read_data=mock_task_file)):
-        with pytest.raises(IndexError):
-            task_manager.tasks = [Task(**task) for task in json.loads(mock_task_file)]
-            task = task_manager.search_by_id(99)
-            assert not task
+    empty_task_manager.tasks = [Task(**task) for task in parsed_tasks]
+    task = empty_task_manager.search_by_id(99)
+    assert task is None
 
 import pytest
 from unittest.mock import patch
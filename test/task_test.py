@@ -41,6 +41,7 @@ from task import Task
         ("14:30", datetime.combine(datetime.now().date(), datetime.strptime("14:30", "%H:%M").time())),  # Только время
         ("1d", datetime.now() + timedelta(days=1)),  # Относительная дата (день)
         ("2h 30m", datetime.now() + timedelta(hours=2, minutes=30)),  # Относительная дата (часы, минуты)
+        ("2h30m", datetime.now() + timedelta(hours=2, minutes=30)),  # Единицы без пробела
         ("1y 2mo", datetime.now() + timedelta(days=366) + timedelta(days=30 + 31)),  # Год и месяцы
         ("2y 4hours", datetime.now() + timedelta(days=365 * 2) + timedelta(hours=4)),  # Год и месяцы
     ]
@@ -57,6 +58,8 @@ def test_parse_due_date_positive(due_date, expected_date):
         "2024-13-15",  # Некорректный месяц
         "2024-12-32",  # Некорректный день
         "-1years",  # Отрицательное значение
+        "1d2",  # Число без единицы измерения
+        "1d завтра",  # Лишний текст
         "abc",  # Некорректный формат
         "",  # Пустая строка
     ]
@@ -104,6 +107,7 @@ def test_constructor_autoincrement_id():
     task1 = Task(title="Task 1")
     task2 = Task(title="Task 2")
     assert task1.id < task2.id
+    assert (task1.id, task2.id) == (0, 1)
 
 
 def test_constructor_custom_id():
@@ -111,12 +115,35 @@ def test_constructor_custom_id():
     assert task.id == 10
 
 
+def test_task_uses_slots():
+    task = Task(title="Slots Task")
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.unknown_attribute = "value"
+
+
+def test_from_trusted_dict_round_trip():
+    task = Task(title="Work Task", description="Описание", category="работа", due_date="2024-12-31 14:30",
+                priority="высокий", status="выполнена", id=7)
+    restored = Task.from_trusted_dict(task.to_dict())
+    assert restored.to_dict() == task.to_dict()
+    assert restored.due_date == datetime(2024, 12, 31, 14, 30)
+
+
+def test_constructor_epoch_due_date():
+    due_date = datetime(2024, 12, 31, 14, 30)
+    task = Task(title="Epoch Task", due_date=int(due_date.timestamp()))
+    assert task.due_date == due_date
+    assert task.to_dict()["due_date"] == int(due_date.timestamp())
+
+
 @pytest.mark.parametrize(
     "title",
     [
         "123 Task",  # Начинается с цифры
         "A valid task",  # Начинается с буквы
         "Задача 1",  # Кириллица
+        "Ёлка",  # Буква Ё
     ]
 )
 def test_constructor_valid_titles(title):
@@ -131,6 +158,8 @@ def test_constructor_valid_titles(title):
         "    ",  # Только пробелы
         "!Invalid",  # Начинается с недопустимого символа
         "@Task",  # Недопустимый символ
+        " Task",  # Начинается с пробела
+        "_Task",  # Начинается с подчеркивания
     ]
 )
 def test_constructor_invalid_titles(invalid_title):